@@ -32,12 +32,15 @@ class ActionNamespace:
     def __init__(self):
         # actions keyed by unqualified name
         self._actions: defaultdict[str, list[Action]] = defaultdict(list)
+        # memoized lookup_action results keyed by name. cleared whenever actions are added
+        self._lookup_cache: dict[str, list[Action]] = {}
 
     def merge(self, other: 'ActionNamespace') -> None:
         """Update the namespace with actions from *other* by
            merging actions from *other* into the list of existing actions with a given name."""
         for k,v in other._actions.items():
             self._actions[k] += v
+        self._lookup_cache.clear()
 
     def _add_action(self, raw_qualified_name: str, function: Callable[[str, str, ActionContext], None|str|Message], exclamation_only:bool|None=None):
         qualified_name = raw_qualified_name.lstrip("!")
@@ -51,6 +54,7 @@ class ActionNamespace:
         exclamation_only = name_has_exclamation or exclamation_only is True
         action = Action(qualified_name=qualified_name, unqualified_name=unqualified_name, function=function, exclamation_only=exclamation_only)
         self._actions[unqualified_name].append(action)
+        self._lookup_cache.clear()
 
     def add_action(self, raw_qualified_name: str, exclamation_only:bool|None=None):
         """a decorator for adding actions to the namespace"""
@@ -65,6 +69,12 @@ class ActionNamespace:
                 action.plugin_config = plugin_config
 
     def lookup_action(self, name: str) -> list[Action]:
+        """Return the actions matching *name*. The returned list must not be modified."""
+        if (result := self._lookup_cache.get(name, None)) is None:
+            result = self._lookup_cache[name] = self._lookup_action_uncached(name)
+        return result
+
+    def _lookup_action_uncached(self, name: str) -> list[Action]:
         name_components = name.split('.')
         unqualified_name = name_components[-1]
         if matches := self._actions.get(unqualified_name, None):
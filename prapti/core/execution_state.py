@@ -6,7 +6,7 @@ from .logger import DiagnosticsLogger
 from .configuration import RootConfiguration
 from .command_message import Message
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionState:
     """
         An ExecutionState is the overall state associated with a single run of
@@ -125,8 +125,11 @@ class DiagnosticsLogger:
     # For example, Path and SourceLocation instances can be passed as type-dispatched
     # extras that associate a source location to the log message. Similarly, the line
     # and column keyword arguments can be used to specify line and column.
+    # log.debug also accepts an args keyword argument that supplies %-style format arguments
+    # for the message. Formatting is deferred until the message is emitted, e.g.:
+    #   log.debug("config = %r", source_loc, args=(config,))
 
-    def _log(self, level, msg_id_or_msg: str, msg_and_or_extras: tuple[Any, ...], kwextras: dict[str, Any]):
+    def _log(self, level, msg_id_or_msg: str, msg_and_or_extras: tuple[Any, ...], kwextras: dict[str, Any], args: tuple[Any, ...] = ()):
         # make the call behave as if the signature is
         #   error([message_id=None], message, *extras, **kwextras)
         if not msg_and_or_extras:
@@ -146,7 +149,7 @@ class DiagnosticsLogger:
         if level >= logging.INFO:
             assert message_id is not None, "message_id is required for logging at 'info' level and above"
 
-        self.logger.log(level, message, extra=self._make_extra(message_id, extras, kwextras))
+        self.logger.log(level, message, *args, extra=self._make_extra(message_id, extras, kwextras))
         self.message_counts[level] += 1
 
     def critical(self, msg_id_or_msg: str, *msg_and_or_extras, **kwextras):
@@ -167,8 +170,12 @@ class DiagnosticsLogger:
     def detail(self, msg_id_or_msg: str, *msg_and_or_extras, **kwextras):
         self._log(DETAIL, msg_id_or_msg, msg_and_or_extras, kwextras)
 
-    def debug(self, msg_id_or_msg: str, *msg_and_or_extras, **kwextras):
-        self._log(logging.DEBUG, msg_id_or_msg, msg_and_or_extras, kwextras)
+    def debug(self, msg_id_or_msg: str, *msg_and_or_extras, args: tuple[Any, ...] = (), **kwextras):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            # fast path: skip decoding extras. count the message as _log does for filtered messages
+            self.message_counts[logging.DEBUG] += 1
+            return
+        self._log(logging.DEBUG, msg_id_or_msg, msg_and_or_extras, kwextras, args)
 
 
 class DiagnosticRecordFormatter(logging.Formatter):
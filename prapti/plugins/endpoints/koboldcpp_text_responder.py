@@ -50,47 +50,55 @@ class KoboldcppResponderConfiguration(BaseModel):
     # stream via generate/stream route
 
 def convert_message_sequence_to_text_prompt(message_sequence: list[Message], log: DiagnosticsLogger) -> str:
-    result = ""
+    result: list[str] = []
     for message in message_sequence:
         if not message.is_enabled or message.is_private:
             continue # skip disabled and private messages
 
         if message.role == "prompt":
             assert len(message.content) == 1 and isinstance(message.content[0], str), "koboldcpp.text: expected flattened message content"
-            result += message.content[0]
+            result.append(message.content[0])
         elif message.role in ("user", "assistant"):
             log.warning("unsupported-chat-role", f"message will not be included in LLM prompt. role '{message.role}' is not supported. use '### @prompt:'.", message.source_loc)
         else:
             log.warning("unrecognised-public-role", f"message will not be included in LLM prompt. public role '{message.role}' is not recognised.", message.source_loc)
             continue
 
-    return result
+    return "".join(result)
 
 class KoboldcppResponder(Responder):
+    def __init__(self):
+        self._session = requests.Session() # reuse connections across generations
+
     def construct_configuration(self, context: ResponderContext) -> BaseModel|tuple[BaseModel, list[tuple[str,VarRef]]]|None:
         return KoboldcppResponderConfiguration(), [("temperature", VarRef("temperature"))]
 
     def generate_responses(self, input_: list[Message], context: ResponderContext) -> list[Message]:
+        log = context.log
+        input_file_path = context.state.input_file_path
+        root_config = context.root_config
+
         config: KoboldcppResponderConfiguration = context.responder_config
-        context.log.debug(f"koboldcpp.text: input: {config = }", context.state.input_file_path)
-        config = resolve_var_refs(config, context.root_config, context.log)
-        context.log.debug(f"koboldcpp.text: resolved: {config = }", context.state.input_file_path)
+        log.debug("koboldcpp.text: input: config = %r", input_file_path, args=(config,))
+        config = resolve_var_refs(config, root_config, log)
+        log.debug("koboldcpp.text: resolved: config = %r", input_file_path, args=(config,))
 
-        prompt = convert_message_sequence_to_text_prompt(input_, context.log)
+        prompt = convert_message_sequence_to_text_prompt(input_, log)
         if not prompt:
-            context.log.error("koboldcpp.text: can't generate completion. prompt is empty.")
+            log.error("koboldcpp.text: can't generate completion. prompt is empty.")
             return []
 
-        if context.root_config.prapti.dry_run:
-            context.log.info("koboldcpp-text-dry-run", "koboldcpp.text: dry run: bailing before hitting the Kobold API", context.state.input_file_path)
-            current_time = str(datetime.datetime.now())
-            return [Message(role="assistant", name=None, content=[f"dry run mode. {current_time}\nconfig = {json.dumps(config.model_dump())}"])]
-
         generate_args = config.model_dump(exclude_none=True, exclude_defaults=True)
-        context.log.debug(f"koboldcpp.text: {generate_args = }")
+        log.debug("koboldcpp.text: generate_args = %r", args=(generate_args,))
+
+        if root_config.prapti.dry_run:
+            log.info("koboldcpp-text-dry-run", "koboldcpp.text: dry run: bailing before hitting the Kobold API", input_file_path)
+            current_time = str(datetime.datetime.now())
+            return [Message(role="assistant", name=None, content=[f"dry run mode. {current_time}\ngenerate_args = {json.dumps(generate_args)}"])]
 
-        response = requests.post(f"{config.api_base}/generate", json={"prompt": prompt, **generate_args}, timeout=1000)
-        response_json = response.json()
+        generate_url = f"{config.api_base}/generate"
+        response = self._session.post(generate_url, json={"prompt": prompt, **generate_args}, timeout=1000)
+        response_json = json.loads(response.content) # parse bytes directly, skips decoding to str first
         response_text = response_json["results"][0]["text"]
 
         return [Message(role="completion", name=None, content=[response_text])]
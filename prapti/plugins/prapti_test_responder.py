@@ -36,19 +36,23 @@ class TestResponder(Responder):
         return TestResponderConfiguration(), [("model", VarRef("model")), ("temperature", VarRef("temperature")), ("n", VarRef("n"))]
 
     def generate_responses(self, input_: list[Message], context: ResponderContext) -> list[Message]:
+        log = context.log
+        input_file_path = context.state.input_file_path
+        root_config = context.root_config
+
         plugin_config: TestResponderConfiguration = context.plugin_config
         assert plugin_config is not None
-        context.log.debug(f"prapti.test.test_responder: input: {plugin_config = }", context.state.input_file_path)
-        plugin_config = resolve_var_refs(plugin_config, context.root_config, context.log)
-        context.log.debug(f"prapti.test.test_responder: resolved: {plugin_config = }", context.state.input_file_path)
+        log.debug("prapti.test.test_responder: input: plugin_config = %r", input_file_path, args=(plugin_config,))
+        plugin_config = resolve_var_refs(plugin_config, root_config, log)
+        log.debug("prapti.test.test_responder: resolved: plugin_config = %r", input_file_path, args=(plugin_config,))
 
         context.state.test_exfil["test_responder_resolved_plugin_config"] = plugin_config
 
         responder_config: TestResponderConfiguration = context.responder_config
         assert responder_config is not None
-        context.log.debug(f"prapti.test.test_responder: input: {responder_config = }", context.state.input_file_path)
-        responder_config = resolve_var_refs(responder_config, context.root_config, context.log)
-        context.log.debug(f"prapti.test.test_responder: resolved: {responder_config = }", context.state.input_file_path)
+        log.debug("prapti.test.test_responder: input: responder_config = %r", input_file_path, args=(responder_config,))
+        responder_config = resolve_var_refs(responder_config, root_config, log)
+        log.debug("prapti.test.test_responder: resolved: responder_config = %r", input_file_path, args=(responder_config,))
 
         context.state.test_exfil["test_responder_resolved_responder_config"] = responder_config
 
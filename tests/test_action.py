@@ -0,0 +1,20 @@
+from prapti.core.action import ActionNamespace
+
+def _noop(name, raw_args, context):
+    return None
+
+def test_lookup_action_after_merge():
+    """Test that action lookups reflect actions merged after an earlier lookup"""
+    actions = ActionNamespace()
+    actions._add_action("a.b.run", _noop)
+    assert [action.qualified_name for action in actions.lookup_action("run")] == ["a.b.run"]
+    assert actions.lookup_action("walk") == []
+
+    other = ActionNamespace()
+    other._add_action("c.run", _noop)
+    other._add_action("c.walk", _noop)
+    actions.merge(other)
+
+    assert [action.qualified_name for action in actions.lookup_action("run")] == ["a.b.run", "c.run"]
+    assert [action.qualified_name for action in actions.lookup_action("c.run")] == ["c.run"]
+    assert [action.qualified_name for action in actions.lookup_action("walk")] == ["c.walk"]
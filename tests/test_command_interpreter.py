@@ -0,0 +1,69 @@
+from prapti.core.command_interpreter import command_regex, is_config_root
+from prapti.core.chat_markdown_parser import parse_messages
+from prapti.core.command_message import Command
+
+def _parse(command_text: str) -> tuple[bool, str, str|None, str]|None:
+    if match := command_regex.match(command_text):
+        return bool(match.group(1)), match.group(2), match.group(3), match.group(4) or ""
+    return None
+
+def test_command_regex_actions():
+    assert _parse("a") == (False, "a", None, "")
+    assert _parse("a  ") == (False, "a", None, "")
+    assert _parse("!a") == (True, "a", None, "")
+    assert _parse("! a.b/c\\d  arg1 arg2\t ") == (True, "a.b/c\\d", None, "arg1 arg2")
+
+def test_command_regex_assignments():
+    assert _parse("x.y = 1") == (False, "x.y", "=", "1")
+    assert _parse("x.y=  \"s\"  ") == (False, "x.y", "=", "\"s\"")
+    assert _parse("x  =   ") == (False, "x", "=", "")
+    assert _parse("a=b=c") == (False, "a", "=", "b=c")
+
+def test_command_regex_unicode():
+    """Test that non-ASCII names (e.g. user vars) and whitespace are accepted"""
+    assert _parse("vars.café = 0.3") == (False, "vars.café", "=", "0.3")
+    assert _parse("x = 1\xa0") == (False, "x", "=", "1")
+    assert _parse("run\xa0arg") == (False, "run", None, "arg")
+
+def test_command_regex_invalid():
+    assert _parse("") is None
+    assert _parse("=x") is None
+
+def test_command_regex_long_whitespace_runs():
+    """Test matching on long runs of whitespace"""
+    # NOTE: a lazy right-hand-side pattern such as `(.*?)\s*$` is quadratic on these inputs
+    # (over 1s each). the current greedy pattern matches them in microseconds.
+    spaces = " " * 16000
+    assert _parse("a x" + spaces + "y") == (False, "a", None, "x" + spaces + "y")
+    assert _parse("a x" + spaces) == (False, "a", None, "x")
+    assert _parse("a = " + spaces + "x" + spaces) == (False, "a", "=", "x")
+
+CONFIG_ROOT_PROMPT = """\
+% prapti.responder.new default prapti.test.test_responder
+//% config_root = true
+### @user:
+% prapti.config_root = true
+"""
+def test_is_config_root():
+    """Test that is_config_root only considers enabled commands in enabled messages"""
+    message_sequence = parse_messages(CONFIG_ROOT_PROMPT.splitlines(keepends=True), None)
+    assert is_config_root(message_sequence)
+
+    # commands disabled after parsing are skipped
+    message_sequence[1].content[0].is_enabled = False
+    assert not is_config_root(message_sequence)
+    message_sequence[1].content[0].is_enabled = True
+
+    message_sequence[1].is_enabled = False
+    assert not is_config_root(message_sequence)
+
+    # commands added to content after parsing are considered
+    message_sequence[1].is_enabled = True
+    message_sequence[1].content = []
+    assert not is_config_root(message_sequence)
+    message_sequence[1].content.append(Command(text="config_root = true"))
+    assert is_config_root(message_sequence)
+
+    # non-ASCII whitespace is accepted, consistent with command_regex
+    message_sequence[1].content = [Command(text="config_root\xa0=\xa0true")]
+    assert is_config_root(message_sequence)
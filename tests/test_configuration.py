@@ -0,0 +1,57 @@
+from pydantic import BaseModel, ConfigDict
+
+import prapti.core.logger
+from prapti.core.configuration import RootConfiguration, VarRef, assign_field, resolve_var_refs, setup_newly_constructed_config
+from prapti.core.source_location import SourceLocation
+
+class _TestConfiguration(BaseModel):
+    model_config = ConfigDict(
+        validate_assignment=True)
+
+    temperature: float = 0.5
+    max_tokens: int|None = None
+
+def test_resolve_var_refs_tracks_assignments():
+    """Test that repeated resolve_var_refs calls reflect var assignments made between calls"""
+    log = prapti.core.logger.create_diagnostics_logger()
+    root_config = RootConfiguration()
+    config = setup_newly_constructed_config((_TestConfiguration(), [("temperature", VarRef("temperature"))]), empty_factory=_TestConfiguration, root_config=root_config, log=log)
+
+    assert resolve_var_refs(config, root_config, log).temperature == 0.5
+
+    assign_field(root_config, "temperature", "0.7", SourceLocation(), log)
+    resolved = resolve_var_refs(config, root_config, log)
+    assert resolved.temperature == 0.7
+    assert config.temperature == 0.5
+
+    # modifying a result does not affect subsequent results
+    resolved.temperature = 0.1
+    assert resolve_var_refs(config, root_config, log).temperature == 0.7
+
+    assign_field(root_config, "temperature", "0.9", SourceLocation(), log)
+    assert resolve_var_refs(config, root_config, log).temperature == 0.9
+
+    # fields set directly on the config (not via assign_field) are reflected in subsequent results
+    config.max_tokens = 42
+    resolved = resolve_var_refs(config, root_config, log)
+    assert resolved.max_tokens == 42
+    assert resolved.temperature == 0.9
+
+def test_resolve_var_refs_reports_errors_on_every_call():
+    """Test that invalid late-bound var values and var ref cycles are reported each time the config is resolved"""
+    log = prapti.core.logger.create_diagnostics_logger()
+    root_config = RootConfiguration()
+    config = setup_newly_constructed_config((_TestConfiguration(), [("temperature", VarRef("temperature"))]), empty_factory=_TestConfiguration, root_config=root_config, log=log)
+
+    assign_field(root_config, "temperature", "\"hot\"", SourceLocation(), log)
+    assert log.error_count() == 0
+    assert resolve_var_refs(config, root_config, log).temperature == 0.5
+    assert log.error_count() == 1
+    assert resolve_var_refs(config, root_config, log).temperature == 0.5
+    assert log.error_count() == 2
+
+    assign_field(root_config, "temperature", "var(temperature)", SourceLocation(), log)
+    resolve_var_refs(config, root_config, log)
+    assert log.error_count() == 3
+    resolve_var_refs(config, root_config, log)
+    assert log.error_count() == 4
@@ -189,3 +189,20 @@ def test_logger_message_counters(log):
         if level in (logging.CRITICAL, logging.ERROR, logging.WARNING):
             continue
         assert message_count == 0, f"should be 0, no level {level} messages were logged"
+
+def test_logger_deferred_format_args(caplog, log):
+    """test that format args are interpolated into the emitted message, and skipped when debug is disabled"""
+    log.debug("message %r %r", Path("fake.md"), args=({"a": 1}, 2))
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage() == "message {'a': 1} 2"
+    assert caplog.records[0].__dict__.get("source_file_path") == Path("fake.md")
+
+    class NoRepr:
+        def __repr__(self):
+            assert False, "should not be formatted"
+
+    log.logger.setLevel(logging.INFO)
+    log.debug("message %r", args=(NoRepr(),))
+    log.logger.setLevel(logging.DEBUG)
+    assert len(caplog.records) == 1